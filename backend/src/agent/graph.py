@@ -3,8 +3,7 @@ from langgraph.graph import END, StateGraph
 from src.agent.nodes.apply_revision import apply_revision_node
 from src.agent.nodes.assemble_draft import assemble_draft_node
 from src.agent.nodes.await_review import await_review_node
-from src.agent.nodes.generate_audio import generate_audio_node
-from src.agent.nodes.generate_image import generate_image_node
+from src.agent.nodes.generate_media import generate_media_node
 from src.agent.nodes.generate_text import generate_text_node
 from src.agent.nodes.index_memory import index_memory_node
 from src.agent.nodes.parse_intent import parse_intent_node
@@ -12,7 +11,6 @@ from src.agent.nodes.plan_post import plan_post_node
 from src.agent.nodes.publish_post import publish_post_node
 from src.agent.nodes.retrieve_context import retrieve_context_node
 from src.agent.routing import (
-    route_after_generate_image,
     route_after_generate_text,
     route_after_parse_intent,
     route_after_plan,
@@ -27,8 +25,7 @@ def build_graph() -> StateGraph:
     g.add_node("retrieve_context", retrieve_context_node)
     g.add_node("plan_post", plan_post_node)
     g.add_node("generate_text", generate_text_node)
-    g.add_node("generate_image", generate_image_node)
-    g.add_node("generate_audio", generate_audio_node)
+    g.add_node("generate_media", generate_media_node)
     g.add_node("assemble_draft", assemble_draft_node)
     g.add_node("await_review", await_review_node)
     g.add_node("apply_revision", apply_revision_node)
@@ -54,22 +51,12 @@ def build_graph() -> StateGraph:
         "generate_text",
         route_after_generate_text,
         {
-            "generate_image": "generate_image",
-            "generate_audio": "generate_audio",
+            "generate_media": "generate_media",
             "assemble_draft": "assemble_draft",
             END: END,
         },
     )
-    g.add_conditional_edges(
-        "generate_image",
-        route_after_generate_image,
-        {
-            "generate_audio": "generate_audio",
-            "assemble_draft": "assemble_draft",
-            END: END,
-        },
-    )
-    g.add_edge("generate_audio", "assemble_draft")
+    g.add_edge("generate_media", "assemble_draft")
     g.add_edge("assemble_draft", "await_review")
     g.add_edge("await_review", END)
 
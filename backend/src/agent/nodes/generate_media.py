@@ -0,0 +1,43 @@
+import asyncio
+
+from src.agent.nodes.generate_audio import generate_audio_node
+from src.agent.nodes.generate_image import generate_image_node
+from src.agent.state import OverallState
+from src.core.llm_json import LLMJsonError
+from src.integrations.deepseek import DeepSeekError
+
+MEDIA_NODES = (
+    ("image", "generate_image", generate_image_node),
+    ("audio", "generate_audio", generate_audio_node),
+)
+EXPECTED_ERRORS = (DeepSeekError, LLMJsonError)
+REDUCED_KEYS = ("completed_steps", "failed_steps", "errors")
+
+
+async def generate_media_node(state: OverallState) -> dict:
+    modalities = state.get("modalities", [])
+    selected = [
+        (step, node) for modality, step, node in MEDIA_NODES if modality in modalities
+    ]
+    if not selected:
+        return {}
+
+    results = await asyncio.gather(
+        *(node(state) for _, node in selected),
+        return_exceptions=True,
+    )
+
+    merged: dict = {}
+    for (step, _), result in zip(selected, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, EXPECTED_ERRORS):
+                raise result
+            merged.setdefault("failed_steps", []).append(step)
+            merged.setdefault("errors", []).append(f"{step}: {result}")
+            continue
+        for key, value in result.items():
+            if key in REDUCED_KEYS:
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged[key] = value
+    return merged
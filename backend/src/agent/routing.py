@@ -11,19 +11,8 @@ def route_after_generate_text(state: OverallState):
     if state.get("status") == "failed":
         return END
     modalities = state.get("modalities", [])
-    if "image" in modalities:
-        return "generate_image"
-    if "audio" in modalities:
-        return "generate_audio"
-    return "assemble_draft"
-
-
-def route_after_generate_image(state: OverallState):
-    if state.get("status") == "failed":
-        return END
-    modalities = state.get("modalities", [])
-    if "audio" in modalities:
-        return "generate_audio"
+    if "image" in modalities or "audio" in modalities:
+        return "generate_media"
     return "assemble_draft"
 
 def route_after_parse_intent(state: OverallState):
@@ -3,4 +3,13 @@ from typing import Literal
 Modality = Literal["text", "image", "audio"]
 Platform = Literal["threads", "instagram"]
 AspectRatio = Literal["16:9", "9:16", "1:1", "3:2", "2:3"]
-MemoryType = Literal["preference", "approved_post", "revision", "brand_doc"]
\ No newline at end of file
+MemoryType = Literal["preference", "approved_post", "revision", "brand_doc"]
+Status = Literal[
+    "pending",
+    "running",
+    "awaiting_review",
+    "publishing",
+    "completed",
+    "failed",
+    "partial",
+]
\ No newline at end of file
@@ -3,19 +3,9 @@ from __future__ import annotations
 import operator
 from typing import Annotated, Literal, Optional
 
-from langchain_core.messages import BaseMessage
-from langgraph.graph.message import add_messages
 from typing_extensions import TypedDict
 
-Status = Literal[
-    "pending",
-    "running",
-    "awaiting_review",
-    "publishing",
-    "completed",
-    "failed",
-    "partial",
-]
+from src.agent.schemas.common import Modality, Platform, Status
 
 
 class OverallState(TypedDict, total=False):
@@ -24,8 +14,8 @@ class OverallState(TypedDict, total=False):
     request_id: str
 
     user_prompt: str
-    modalities: list[Literal["text", "image", "audio"]]
-    target_platforms: list[Literal["threads", "instagram"]]
+    modalities: list[Modality]
+    target_platforms: list[Platform]
 
     context_block: str
     post_plan: dict
@@ -39,8 +29,6 @@ class OverallState(TypedDict, total=False):
     draft_version: int
     approval_status: Literal["draft", "awaiting_review", "approved", "rejected"]
 
-    messages: Annotated[list[BaseMessage], add_messages]
-
     completed_steps: Annotated[list[str], operator.add]
     failed_steps: Annotated[list[str], operator.add]
     errors: Annotated[list[str], operator.add]
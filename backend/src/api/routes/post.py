@@ -1,12 +1,18 @@
+import json
+import logging
+from collections.abc import AsyncIterator
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from langgraph.graph.state import CompiledStateGraph
 
 from src.api.deps import get_app_settings, get_graph, graph_config, resolve_status
 from src.api.schemas.post import CreatePostRequest, PostResponse
 from src.core.config import Settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
@@ -56,20 +62,15 @@ def _build_invoke_config(settings: Settings, thread_id: str) -> dict:
     return config
 
 
-@router.post("", response_model=PostResponse)
-async def create_post(
+def _build_input_state(
     body: CreatePostRequest,
-    graph: CompiledStateGraph = Depends(get_graph),
-    settings: Settings = Depends(get_app_settings),
-) -> PostResponse:
-    thread_id = f"thread_{uuid4()}"
-    request_id = str(uuid4())
-    config = _build_invoke_config(settings, thread_id)
-
-    input_state = {
+    settings: Settings,
+    thread_id: str,
+) -> dict:
+    return {
         "thread_id": thread_id,
         "user_id": body.user_id or settings.default_user_id,
-        "request_id": request_id,
+        "request_id": str(uuid4()),
         "user_prompt": body.user_prompt,
         "modalities": body.modalities,
         "status": "pending",
@@ -80,6 +81,22 @@ async def create_post(
         "errors": [],
     }
 
+
+def _sse_event(event: str, data: dict) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("", response_model=PostResponse)
+async def create_post(
+    body: CreatePostRequest,
+    graph: CompiledStateGraph = Depends(get_graph),
+    settings: Settings = Depends(get_app_settings),
+) -> PostResponse:
+    thread_id = f"thread_{uuid4()}"
+    config = _build_invoke_config(settings, thread_id)
+    input_state = _build_input_state(body, settings, thread_id)
+
     await graph.ainvoke(input_state, config=config)
     snapshot = await graph.aget_state(config)
     if snapshot is None:
@@ -92,6 +109,36 @@ async def create_post(
     )
 
 
+@router.post("/stream")
+async def stream_post(
+    body: CreatePostRequest,
+    graph: CompiledStateGraph = Depends(get_graph),
+    settings: Settings = Depends(get_app_settings),
+) -> StreamingResponse:
+    thread_id = f"thread_{uuid4()}"
+    config = _build_invoke_config(settings, thread_id)
+    input_state = _build_input_state(body, settings, thread_id)
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for update in graph.astream(input_state, config=config, stream_mode="updates"):
+                if "__interrupt__" in update:
+                    continue
+                yield _sse_event("partial", update)
+
+            snapshot = await graph.aget_state(config)
+            if snapshot is None:
+                yield _sse_event("error", {"detail": "Graph state unavailable after invoke"})
+                return
+            response = _state_to_response(thread_id, snapshot.values, snapshot.next)
+            yield _sse_event("done", response.model_dump(mode="json"))
+        except Exception as e:
+            logger.exception("stream_post failed for thread_id=%s", thread_id)
+            yield _sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/{thread_id}", response_model=PostResponse)
 async def get_post(
     thread_id: str,
@@ -1,18 +1,6 @@
-from typing import Literal
-
 from pydantic import BaseModel, Field
 
-Modality = Literal["text", "image", "audio"]
-Platform = Literal["threads", "instagram"]
-Status = Literal[
-    "pending",
-    "running",
-    "awaiting_review",
-    "publishing",
-    "completed",
-    "failed",
-    "partial",
-]
+from src.agent.schemas.common import Modality, Platform, Status
 
 
 class CreatePostRequest(BaseModel):
@@ -8,7 +8,8 @@ from src.agent.graph import compile_graph
 from src.api.routes.health import router as health_router
 from src.api.routes.post import router as post_router
 from src.core.config import get_settings
-from src.core.logging import setup_logging
+from src.core.http import close_http_client
+from src.core.logging import setup_logging, shutdown_logging
 
 
 @asynccontextmanager
@@ -22,6 +23,9 @@ async def lifespan(app: FastAPI):
         app.state.checkpointer = checkpointer
         yield
 
+    await close_http_client()
+    shutdown_logging()
+
 
 app = FastAPI(title="AMA", lifespan=lifespan)
 app.include_router(health_router)
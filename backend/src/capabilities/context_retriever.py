@@ -1,15 +1,24 @@
 from __future__ import annotations
 import logging
+from src.core.circuit_breaker import CircuitBreaker
 from src.core.config import get_settings
-from src.memory.embedder import embed_texts
+from src.memory.embedder import embed_query
 from src.memory.errors import MemoryError
 from src.memory.formatter import format_memory_hits
 from src.memory.store import search_memories
 
-logger = logging.getlogger(__name__)
+logger = logging.getLogger(__name__)
 
 DEFAULT_TOP_K = 5
 MAX_CONTEXT_CHARS = 2000
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30.0
+TRANSIENT_ERROR_KINDS = frozenset({"embed", "search", "store"})
+
+_breaker = CircuitBreaker(
+    failure_threshold=BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=BREAKER_RESET_TIMEOUT,
+)
 
 async def retrieve_context(
         user_id: str,
@@ -28,22 +37,30 @@ async def retrieve_context(
     
     top_k = k or getattr(settings,"rag_top_k",DEFAULT_TOP_K)
 
+    if not _breaker.allow_request():
+        raise MemoryError.unavailable("memory circuit open")
+
     try:
-        vectors = await embed_texts([cleaned_prompt])
-        if not vectors or not vectors[0]:
-            raise MemoryError("Empty embedding for query")
-        
+        vector = await embed_query(cleaned_prompt)
+        if not vector:
+            raise MemoryError.embed("Empty embedding for query")
+
         hits = await search_memories(
             user_id=user_id,
-            query_vector=vectors[0],
+            query_vector=vector,
             k=top_k,
         )
-    except MemoryError:
+    except MemoryError as e:
+        if e.kind in TRANSIENT_ERROR_KINDS:
+            _breaker.record_failure()
         raise
     except Exception as e:
+        _breaker.record_failure()
         logger.exception("retrive_context failed")
         raise MemoryError(str(e)) from e
-    
+
+    _breaker.record_success()
+
     if not hits:
         logger.info("retrieve_context: no hits for user_id=%s", user_id)
         return ""
@@ -2,11 +2,16 @@ import logging
 
 from src.agent.prompts.intent import build_intent_messages
 from src.agent.schemas.intent import ParsedIntentOutput
+from src.core.cache import LRUCache
 from src.core.llm_json import LLMJsonError, parse_and_validate
 from src.integrations.deepseek import DeepSeekError, chat_completion
 
 logger = logging.getLogger(__name__)
 
+INTENT_CACHE_SIZE = 256
+
+_intent_cache: LRUCache[ParsedIntentOutput] = LRUCache(maxsize=INTENT_CACHE_SIZE)
+
 
 def parse_intent_stub(user_prompt: str, modalities: list | None) -> dict:
     return ParsedIntentOutput(
@@ -17,6 +22,11 @@ def parse_intent_stub(user_prompt: str, modalities: list | None) -> dict:
 
 
 async def parse_intent_with_llm(user_prompt: str) -> dict:
+    cached = _intent_cache.get(user_prompt)
+    if cached is not None:
+        logger.info("parse_intent: cache hit")
+        return cached.model_dump()
+
     messages = build_intent_messages(user_prompt, requested_modalities=None)
     logger.info("parse_intent: calling DeepSeek")
 
@@ -33,6 +43,7 @@ async def parse_intent_with_llm(user_prompt: str) -> dict:
         logger.error("parse_intent: invalid JSON from model: %s", e)
         raise
 
+    _intent_cache.set(user_prompt, parsed)
     return parsed.model_dump()
 
 
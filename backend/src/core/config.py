@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     embedding_model: str = "text-embedding-3-small"
     embedding_timeout: float = 30.0
     embedding_dimensions: int = 1536
+    embedding_max_retries: int = 1
+    embedding_retry_base_delay: float = 0.5
     replicate_api_token: str | None = None
     output_dir: str = "data/outputs"
     checkpoint_db_path: str = "data/checkpoints.db"
@@ -22,6 +24,9 @@ class Settings(BaseSettings):
     deepseek_model: str = "deepseek-chat"
     deepseek_timeout: float = 60.0
     deepseek_temperature: float = 0.2
+    deepseek_max_retries: int = 2
+    deepseek_retry_base_delay: float = 1.0
+    deepseek_retry_max_delay: float = 30.0
     langfuse_enabled: bool = False
     langfuse_public_key: str | None = None
     langfuse_secret_key: str | None = None
@@ -4,9 +4,38 @@ from typing import TypeVar, Type
 from pydantic import BaseModel, ValidationError
 T = TypeVar("T", bound=BaseModel)
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+
 class LLMJsonError(ValueError):
     pass
 
+def _find_json_object(text: str, start: int = 0) -> tuple[int, int] | None:
+    start = text.find("{", start)
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
 def extract_json_dict(text: str) -> dict:
     if not text or not isinstance(text, str):
         raise LLMJsonError("Input must be a non-empty string")
@@ -19,7 +48,7 @@ def extract_json_dict(text: str) -> dict:
     except json.JSONDecodeError:
         pass
 
-    fence_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", cleaned, re.DOTALL | re.IGNORECASE)
+    fence_match = _FENCE_RE.search(cleaned)
     if fence_match:
         try:
             parsed = json.loads(fence_match.group(1))
@@ -28,15 +57,23 @@ def extract_json_dict(text: str) -> dict:
         except json.JSONDecodeError as e:
             raise LLMJsonError(f"Invalid JSON inside markdown fence: {e}") from e
         
-    brace_match = re.search(r"\{.*\}", cleaned, re.DOTALL)
-    if brace_match:
+    # Prose like "use {placeholders}" can precede the real object, so a
+    # balanced span that fails to parse resumes the scan after its end.
+    # Never rescanning inside a span keeps this linear and never returns a
+    # nested object in place of a malformed outer one.
+    last_error: json.JSONDecodeError | None = None
+    pos = 0
+    while (span := _find_json_object(cleaned, pos)) is not None:
         try:
-            parsed = json.loads(brace_match.group(0))
+            parsed = json.loads(cleaned[span[0]:span[1]])
             if isinstance(parsed, dict):
                 return parsed
         except json.JSONDecodeError as e:
-            raise LLMJsonError(f"Invalid JSON in extracted block: {e}") from e
+            last_error = e
+        pos = span[1]
 
+    if last_error is not None:
+        raise LLMJsonError(f"Invalid JSON in extracted block: {last_error}") from last_error
     raise LLMJsonError("Could not extract JSON object from text")
 
 def parse_and_validate(text: str, model: Type[T]) -> T:
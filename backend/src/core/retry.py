@@ -0,0 +1,50 @@
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_DELAY = 30.0
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base: float,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> float:
+    return min(max_delay, base * (2**attempt) * random.uniform(0.5, 1.5))
+
+
+async def retry_async(
+    call: Callable[[], Awaitable[T]],
+    *,
+    label: str,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> T:
+    # Errors opt in to retries through a truthy `retryable` attribute.
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if not getattr(e, "retryable", False) or attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt, base=base_delay, max_delay=max_delay)
+            attempt += 1
+            logger.warning(
+                "%s failed (%s), retrying in %.2fs (attempt %d/%d)",
+                label,
+                e,
+                delay,
+                attempt,
+                max_retries,
+            )
+            await asyncio.sleep(delay)
@@ -6,6 +6,8 @@ from typing import Any, Literal
 import httpx
 
 from src.core.config import get_settings
+from src.core.http import get_http_client
+from src.core.retry import RETRYABLE_STATUS_CODES, retry_async
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,12 @@ class DeepSeekError(Exception):
         self.status_code = status_code
         super().__init__(message)
 
+    @property
+    def retryable(self) -> bool:
+        if self.kind == "network":
+            return True
+        return self.kind == "api" and self.status_code in RETRYABLE_STATUS_CODES
+
     @classmethod
     def auth(cls, message: str) -> DeepSeekError:
         return cls(message, kind="auth", status_code=401)
@@ -78,20 +86,33 @@ async def chat_completion(
         "Content-Type": "application/json",
     }
 
+    url = f"{settings.deepseek_base_url.rstrip('/')}/chat/completions"
+    return await retry_async(
+        lambda: _post_completion(url, payload, headers, resolved_timeout),
+        label="DeepSeek chat completion",
+        max_retries=settings.deepseek_max_retries,
+        base_delay=settings.deepseek_retry_base_delay,
+        max_delay=settings.deepseek_retry_max_delay,
+    )
+
+
+async def _post_completion(
+    url: str,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    timeout: float,
+) -> str:
     try:
-        async with httpx.AsyncClient(
-            base_url=settings.deepseek_base_url,
-            timeout=resolved_timeout,
-        ) as client:
-            response = await client.post(
-                "/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-    except httpx.TimeoutException:
-        raise DeepSeekError.timeout(resolved_timeout)
+        response = await get_http_client().post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=timeout,
+        )
+    except httpx.TimeoutException as e:
+        raise DeepSeekError.timeout(timeout) from e
     except httpx.RequestError as e:
-        raise DeepSeekError.network(str(e))
+        raise DeepSeekError.network(str(e)) from e
 
     if response.status_code == 401:
         raise DeepSeekError.auth("Invalid DeepSeek API key")
@@ -2,10 +2,17 @@ from __future__ import annotations
 import logging
 from typing import Any
 import httpx
+from src.core.cache import LRUCache
 from src.core.config import get_settings
+from src.core.http import get_http_client
+from src.core.retry import RETRYABLE_STATUS_CODES, retry_async
 from src.memory.errors import MemoryError
 logger = logging.getLogger(__name__)
 
+QUERY_CACHE_SIZE = 512
+
+_query_cache: LRUCache[tuple[float, ...]] = LRUCache(maxsize=QUERY_CACHE_SIZE)
+
 async def embed_texts(texts: list[str]) -> list[list[float]]:
     if not texts:
         return []
@@ -33,24 +40,44 @@ async def embed_texts(texts: list[str]) -> list[list[float]]:
     }
     base_url = getattr(settings, "embedding_base_url", "https://api.openai.com/v1")
     timeout = getattr(settings, "embedding_timeout", 30.0)
+    url = f"{base_url.rstrip('/')}/embeddings"
 
-    try:
-        async with httpx.AsyncClient(base_url=base_url,timeout=timeout) as client:
-            response = await client.post("/embeddings",json=payload,headers=headers)
+    return await retry_async(
+        lambda: _post_embeddings(url, payload, headers, timeout, len(cleaned)),
+        label="Embedding request",
+        max_retries=getattr(settings, "embedding_max_retries", 1),
+        base_delay=getattr(settings, "embedding_retry_base_delay", 0.5),
+    )
 
-    except httpx.TimeoutException:
-        raise MemoryError.embed(f"Embedding request timed out after {timeout}s")
-    
+
+async def _post_embeddings(
+    url: str,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    timeout: float,
+    expected: int,
+) -> list[list[float]]:
+    try:
+        response = await get_http_client().post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=timeout,
+        )
+    except httpx.TimeoutException as e:
+        raise MemoryError.embed(f"Embedding request timed out after {timeout}s") from e
     except httpx.RequestError as e:
-        raise MemoryError.embed(f"Embedding network error: {e}") from e
-    
+        raise MemoryError.embed(f"Embedding network error: {e}", retryable=True) from e
+
     if response.status_code == 401:
         raise MemoryError.config("Invalid OPENAI_API_KEY")
-    
+
     if response.status_code >= 400:
         logger.error("Embedding API %s: %s", response.status_code, response.text)
-        raise MemoryError.embed(f"Embedding API {response.status_code}: {response.text}")
-
+        raise MemoryError.embed(
+            f"Embedding API {response.status_code}: {response.text}",
+            retryable=response.status_code in RETRYABLE_STATUS_CODES,
+        )
 
     try:
         data = response.json()
@@ -59,16 +86,21 @@ async def embed_texts(texts: list[str]) -> list[list[float]]:
         vectors = [item["embedding"] for item in items]
     except (KeyError, TypeError, ValueError) as e:
         raise MemoryError.embed(f"Unexpected embedding response: {response.text}") from e
-    
-    if len(vectors) != len(cleaned):
+
+    if len(vectors) != expected:
         raise MemoryError.embed(
-            f"Expected {len(cleaned)} vectors, got {len(vectors)}"
+            f"Expected {expected} vectors, got {len(vectors)}"
         )
-    
+
     return vectors
 
 
 async def embed_query(text: str) -> list[float]:
-    vectors = await embed_texts([text])
+    key = text.strip()
+    cached = _query_cache.get(key)
+    if cached is not None:
+        return list(cached)
 
-    return vectors[0]
\ No newline at end of file
+    vectors = await embed_texts([text])
+    _query_cache.set(key, tuple(vectors[0]))
+    return vectors[0]
@@ -1,12 +1,19 @@
 from __future__ import annotations
 from typing import Literal
 
-MemoryErrorKind = Literal["config","embed","store","search","empty"]
+MemoryErrorKind = Literal["config","embed","store","search","empty","unavailable"]
 
 class MemoryError(Exception):
-    def __init__(self, message:str,*,kind: MemoryErrorKind = "store") -> None:
+    def __init__(
+        self,
+        message:str,
+        *,
+        kind: MemoryErrorKind = "store",
+        retryable: bool = False,
+    ) -> None:
         self.message = message
         self.kind = kind
+        self.retryable = retryable
         super().__init__(message)
 
     @classmethod
@@ -14,8 +21,8 @@ class MemoryError(Exception):
         return cls(message,kind="config")
     
     @classmethod
-    def embed(cls, message:str) -> MemoryError:
-        return cls(message,kind="embed")
+    def embed(cls, message:str, *, retryable: bool = False) -> MemoryError:
+        return cls(message,kind="embed",retryable=retryable)
 
     @classmethod
     def store(cls, message: str) -> MemoryError:
@@ -23,4 +30,8 @@ class MemoryError(Exception):
     
     @classmethod
     def search(cls, message: str) -> MemoryError:
-        return cls(message, kind="search")
\ No newline at end of file
+        return cls(message, kind="search")
+
+    @classmethod
+    def unavailable(cls, message: str) -> MemoryError:
+        return cls(message, kind="unavailable")
\ No newline at end of file
@@ -9,6 +9,7 @@ from src.memory.errors import MemoryError
 
 logger = logging.getLogger(__name__)
 _client: AsyncQdrantClient | None = None
+_ensured_collections: set[str] = set()
 
 def _get_client() -> AsyncQdrantClient:
     global _client
@@ -21,12 +22,16 @@ def _get_client() -> AsyncQdrantClient:
 async def ensure_collection() -> None:
     settings = get_settings()
     collection = getattr(settings,"qdrant_collection","ama_memory")
+    if collection in _ensured_collections:
+        return
+
     dim = getattr(settings,"embedding_dimensions",1536)
     client = _get_client()
 
     try:
         exists = await client.collection_exists(collection)
         if exists:
+            _ensured_collections.add(collection)
             return
         
         await client.create_collection(
@@ -42,6 +47,7 @@ async def ensure_collection() -> None:
             field_name="user_id",
             field_schema=qm.PayloadSchemaType.KEYWORD
         )
+        _ensured_collections.add(collection)
         logger.info("Created Qdrant collection %s (dim=%d)", collection, dim)
     except Exception as e:
         raise MemoryError.store(f"ensure_collection failed: {e}") from e
@@ -144,6 +150,7 @@ async def search_memories(*,user_id:str,query_vector:list[float],k: int=5,) -> l
 
 async def close_store() -> None:
     global _client
+    _ensured_collections.clear()
     if _client is not None:
         await _client.close()
         _client = None
\ No newline at end of file
@@ -0,0 +1,25 @@
+import pytest
+
+from src.core.config import get_settings
+from src.core.http import close_http_client
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test-key")
+    monkeypatch.setenv("DEEPSEEK_BASE_URL", "https://deepseek.test/v1")
+    monkeypatch.setenv("DEEPSEEK_MAX_RETRIES", "2")
+    monkeypatch.setenv("DEEPSEEK_RETRY_BASE_DELAY", "0")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("EMBEDDING_BASE_URL", "https://openai.test/v1")
+    monkeypatch.setenv("EMBEDDING_MAX_RETRIES", "1")
+    monkeypatch.setenv("EMBEDDING_RETRY_BASE_DELAY", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+async def http_client():
+    yield
+    await close_http_client()
@@ -0,0 +1,66 @@
+import pytest
+
+from src.capabilities import context_retriever
+from src.core.circuit_breaker import CircuitBreaker
+from src.memory.errors import MemoryError
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    monkeypatch.setattr(context_retriever, "_breaker", breaker)
+    return breaker
+
+
+def failing_embed(error: MemoryError):
+    async def embed_query(text: str) -> list[float]:
+        raise error
+
+    return embed_query
+
+
+async def test_transient_errors_open_the_circuit(monkeypatch, breaker):
+    monkeypatch.setattr(
+        context_retriever, "embed_query", failing_embed(MemoryError.embed("down"))
+    )
+    for _ in range(2):
+        with pytest.raises(MemoryError, match="down"):
+            await context_retriever.retrieve_context("u1", "hello")
+
+    with pytest.raises(MemoryError, match="memory circuit open") as exc:
+        await context_retriever.retrieve_context("u1", "hello")
+    assert exc.value.kind == "unavailable"
+
+
+async def test_config_errors_do_not_open_the_circuit(monkeypatch, breaker):
+    monkeypatch.setattr(
+        context_retriever, "embed_query", failing_embed(MemoryError.config("no key"))
+    )
+    for _ in range(3):
+        with pytest.raises(MemoryError, match="no key"):
+            await context_retriever.retrieve_context("u1", "hello")
+
+    assert breaker.allow_request()
+
+
+def test_half_open_admits_a_single_trial(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.core.circuit_breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now[0] += 10.0
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    now[0] += 5.0
+    assert not breaker.allow_request()
+
+    now[0] += 5.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request()
+    assert breaker.allow_request()
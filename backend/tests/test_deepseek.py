@@ -0,0 +1,74 @@
+import httpx
+import pytest
+
+from src.core.retry import backoff_delay
+from src.integrations.deepseek import DeepSeekError, chat_completion
+
+URL = "https://deepseek.test/v1/chat/completions"
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def completion(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}]}
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+async def test_retries_retryable_status(httpx_mock, status_code):
+    httpx_mock.add_response(url=URL, status_code=status_code)
+    httpx_mock.add_response(url=URL, json=completion("ok"))
+
+    assert await chat_completion(MESSAGES) == "ok"
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_no_retry_on_auth_error(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=401)
+
+    with pytest.raises(DeepSeekError) as exc:
+        await chat_completion(MESSAGES)
+
+    assert exc.value.kind == "auth"
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.parametrize("status_code", [400, 404, 422])
+async def test_no_retry_on_client_error(httpx_mock, status_code):
+    httpx_mock.add_response(url=URL, status_code=status_code)
+
+    with pytest.raises(DeepSeekError) as exc:
+        await chat_completion(MESSAGES)
+
+    assert exc.value.status_code == status_code
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_no_retry_on_timeout(httpx_mock):
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=URL)
+
+    with pytest.raises(DeepSeekError) as exc:
+        await chat_completion(MESSAGES)
+
+    assert exc.value.kind == "timeout"
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_retries_network_error(httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url=URL)
+    httpx_mock.add_response(url=URL, json=completion("ok"))
+
+    assert await chat_completion(MESSAGES) == "ok"
+
+
+async def test_gives_up_after_max_retries(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=503, is_reusable=True)
+
+    with pytest.raises(DeepSeekError) as exc:
+        await chat_completion(MESSAGES)
+
+    assert exc.value.status_code == 503
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_backoff_delay_is_clamped_after_jitter():
+    for attempt in range(10):
+        assert backoff_delay(attempt, base=1.0, max_delay=5.0) <= 5.0
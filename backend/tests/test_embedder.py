@@ -0,0 +1,107 @@
+import httpx
+import pytest
+
+from src.core.cache import LRUCache
+from src.memory import embedder
+from src.memory.embedder import embed_query, embed_texts
+from src.memory.errors import MemoryError
+
+URL = "https://openai.test/v1/embeddings"
+
+
+def embeddings(*vectors: list[float]) -> dict:
+    return {"data": [{"index": i, "embedding": v} for i, v in enumerate(vectors)]}
+
+
+async def test_retries_retryable_status(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=503)
+    httpx_mock.add_response(url=URL, json=embeddings([0.1, 0.2]))
+
+    assert await embed_texts(["hello"]) == [[0.1, 0.2]]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_gives_up_after_max_retries(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=429, is_reusable=True)
+
+    with pytest.raises(MemoryError) as exc:
+        await embed_texts(["hello"])
+
+    assert exc.value.kind == "embed"
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_no_retry_on_invalid_key(httpx_mock):
+    httpx_mock.add_response(url=URL, status_code=401)
+
+    with pytest.raises(MemoryError) as exc:
+        await embed_texts(["hello"])
+
+    assert exc.value.kind == "config"
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_timeout_is_not_retried_and_keeps_cause(httpx_mock):
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=URL)
+
+    with pytest.raises(MemoryError) as exc:
+        await embed_texts(["hello"])
+
+    assert isinstance(exc.value.__cause__, httpx.ReadTimeout)
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_network_error_keeps_cause(httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url=URL, is_reusable=True)
+
+    with pytest.raises(MemoryError) as exc:
+        await embed_texts(["hello"])
+
+    assert isinstance(exc.value.__cause__, httpx.ConnectError)
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.fixture
+def query_cache(monkeypatch):
+    cache = LRUCache(maxsize=2)
+    monkeypatch.setattr(embedder, "_query_cache", cache)
+    return cache
+
+
+async def test_repeated_query_is_served_from_cache(httpx_mock, query_cache):
+    httpx_mock.add_response(url=URL, json=embeddings([0.1, 0.2]))
+
+    assert await embed_query("hello") == [0.1, 0.2]
+    assert await embed_query(" hello ") == [0.1, 0.2]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_cached_vector_cannot_be_mutated(httpx_mock, query_cache):
+    httpx_mock.add_response(url=URL, json=embeddings([0.1, 0.2]))
+
+    (await embed_query("hello")).append(9.9)
+    (await embed_query("hello")).append(9.9)
+
+    assert await embed_query("hello") == [0.1, 0.2]
+
+
+async def test_failed_query_is_not_cached(httpx_mock, query_cache):
+    httpx_mock.add_response(url=URL, status_code=400)
+    httpx_mock.add_response(url=URL, json=embeddings([0.1, 0.2]))
+
+    with pytest.raises(MemoryError):
+        await embed_query("hello")
+    assert await embed_query("hello") == [0.1, 0.2]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_query_cache_evicts_least_recently_used(httpx_mock, query_cache):
+    httpx_mock.add_response(url=URL, json=embeddings([0.1]), is_reusable=True)
+
+    for text in ("one", "two", "three"):
+        await embed_query(text)
+    await embed_query("three")
+    assert len(httpx_mock.get_requests()) == 3
+
+    await embed_query("one")
+    assert len(httpx_mock.get_requests()) == 4
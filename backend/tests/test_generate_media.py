@@ -0,0 +1,69 @@
+import pytest
+
+from src.agent.nodes import generate_media
+from src.integrations.deepseek import DeepSeekError
+
+
+async def image_node(state):
+    return {"image_path": "image.png", "completed_steps": ["generate_image"]}
+
+
+async def audio_node(state):
+    return {"audio_path": "audio.mp3", "completed_steps": ["generate_audio"]}
+
+
+async def failing_image_node(state):
+    raise DeepSeekError.api(503, "unavailable")
+
+
+async def broken_audio_node(state):
+    raise RuntimeError("bug")
+
+
+def use_nodes(monkeypatch, image, audio):
+    monkeypatch.setattr(
+        generate_media,
+        "MEDIA_NODES",
+        (("image", "generate_image", image), ("audio", "generate_audio", audio)),
+    )
+
+
+async def test_merges_both_branches(monkeypatch):
+    use_nodes(monkeypatch, image_node, audio_node)
+
+    result = await generate_media.generate_media_node({"modalities": ["text", "image", "audio"]})
+
+    assert result == {
+        "image_path": "image.png",
+        "audio_path": "audio.mp3",
+        "completed_steps": ["generate_image", "generate_audio"],
+    }
+
+
+async def test_records_expected_failure_and_keeps_other_branch(monkeypatch):
+    use_nodes(monkeypatch, failing_image_node, audio_node)
+
+    result = await generate_media.generate_media_node({"modalities": ["image", "audio"]})
+
+    assert result == {
+        "failed_steps": ["generate_image"],
+        "errors": ["generate_image: unavailable"],
+        "audio_path": "audio.mp3",
+        "completed_steps": ["generate_audio"],
+    }
+    assert "status" not in result
+
+
+async def test_unexpected_errors_propagate(monkeypatch):
+    use_nodes(monkeypatch, image_node, broken_audio_node)
+
+    with pytest.raises(RuntimeError, match="bug"):
+        await generate_media.generate_media_node({"modalities": ["image", "audio"]})
+
+
+async def test_skips_unselected_modalities(monkeypatch):
+    use_nodes(monkeypatch, image_node, broken_audio_node)
+
+    result = await generate_media.generate_media_node({"modalities": ["image"]})
+
+    assert result == {"image_path": "image.png", "completed_steps": ["generate_image"]}
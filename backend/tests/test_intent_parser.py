@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from src.capabilities import intent_parser
+from src.core.cache import LRUCache
+from src.core.llm_json import LLMJsonError
+from src.integrations.deepseek import DeepSeekError
+
+VALID_REPLY = json.dumps({"cleaned_prompt": "ok", "modalities": ["text"]})
+
+
+class FakeDeepSeek:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.replies: list = []
+
+    async def __call__(self, messages, **kwargs) -> str:
+        self.calls += 1
+        reply = self.replies.pop(0) if self.replies else VALID_REPLY
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.fixture
+def deepseek(monkeypatch):
+    fake = FakeDeepSeek()
+    monkeypatch.setattr(intent_parser, "chat_completion", fake)
+    monkeypatch.setattr(intent_parser, "_intent_cache", LRUCache(maxsize=2))
+    return fake
+
+
+async def test_repeated_prompt_is_served_from_cache(deepseek):
+    first = await intent_parser.parse_intent("write a post", None)
+    second = await intent_parser.parse_intent("write a post", None)
+
+    assert first == second
+    assert deepseek.calls == 1
+
+
+async def test_deepseek_failures_are_not_cached(deepseek):
+    deepseek.replies.append(DeepSeekError.api(503, "unavailable"))
+
+    with pytest.raises(DeepSeekError):
+        await intent_parser.parse_intent("write a post", None)
+    await intent_parser.parse_intent("write a post", None)
+
+    assert deepseek.calls == 2
+
+
+async def test_invalid_json_is_not_cached(deepseek):
+    deepseek.replies.append("not json")
+
+    with pytest.raises(LLMJsonError):
+        await intent_parser.parse_intent("write a post", None)
+    await intent_parser.parse_intent("write a post", None)
+
+    assert deepseek.calls == 2
+
+
+async def test_cache_evicts_least_recently_used(deepseek):
+    for prompt in ("one", "two", "three"):
+        await intent_parser.parse_intent(prompt, None)
+    assert deepseek.calls == 3
+
+    await intent_parser.parse_intent("three", None)
+    assert deepseek.calls == 3
+
+    await intent_parser.parse_intent("one", None)
+    assert deepseek.calls == 4
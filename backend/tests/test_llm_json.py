@@ -0,0 +1,73 @@
+import pytest
+
+from src.core.llm_json import LLMJsonError, _find_json_object, extract_json_dict
+
+
+def test_bare_json():
+    assert extract_json_dict('{"a": 1}') == {"a": 1}
+
+
+def test_fenced_json():
+    assert extract_json_dict('Here:\n```json\n{"a": 1}\n```') == {"a": 1}
+
+
+def test_closing_brace_inside_string():
+    assert extract_json_dict('Result: {"text": "a } b"} done') == {"text": "a } b"}
+
+
+def test_brace_in_trailing_prose():
+    text = 'Sure! {"a": 1}\nLet me know if you want {more} changes.'
+    assert extract_json_dict(text) == {"a": 1}
+
+
+def test_escaped_quotes_inside_string():
+    text = 'Output: {"quote": "she said \\"hi {there}\\""} thanks'
+    assert extract_json_dict(text) == {"quote": 'she said "hi {there}"'}
+
+
+def test_prose_braces_before_real_object():
+    text = 'Fill in {x} as needed: {"caption": "hello"}'
+    assert extract_json_dict(text) == {"caption": "hello"}
+
+
+def test_unbalanced_input_has_no_object():
+    assert _find_json_object('{"a": {"b": 1}') is None
+
+
+def test_unbalanced_input_raises():
+    with pytest.raises(LLMJsonError, match="Could not extract"):
+        extract_json_dict('prefix {"a": 1, "b": [2')
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": {"b": 1}',
+        'Note the { symbol. {"a": {"b": 2}}',
+    ],
+)
+def test_truncated_outer_object_raises(text):
+    with pytest.raises(LLMJsonError, match="Could not extract"):
+        extract_json_dict(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        """{'caption': 'x', "meta": {"a": 1}}""",
+        '{"caption": "x", "tags": ["a",], "meta": {"k": 2}}',
+    ],
+)
+def test_malformed_outer_object_does_not_return_nested_object(text):
+    with pytest.raises(LLMJsonError, match="Invalid JSON in extracted block"):
+        extract_json_dict(text)
+
+
+def test_unclosed_braces_scan_in_linear_time():
+    with pytest.raises(LLMJsonError, match="Could not extract"):
+        extract_json_dict("x" + "{" * 200_000)
+
+
+def test_invalid_candidate_raises():
+    with pytest.raises(LLMJsonError, match="Invalid JSON in extracted block"):
+        extract_json_dict("see {not json} here")
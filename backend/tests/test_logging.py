@@ -0,0 +1,30 @@
+import logging
+import logging.handlers
+
+import pytest
+
+from src.core.logging import setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def root_level():
+    root = logging.getLogger()
+    level = root.level
+    yield
+    shutdown_logging()
+    root.setLevel(level)
+
+
+def test_logging_survives_setup_shutdown_cycle(capsys, root_level):
+    logger = logging.getLogger("tests.logging")
+    for message in ("first", "second"):
+        setup_logging()
+        logger.warning("%s message", message)
+        shutdown_logging()
+
+    err = capsys.readouterr().err
+    assert "WARNING [tests.logging] first message" in err
+    assert "WARNING [tests.logging] second message" in err
+    assert not any(
+        isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers
+    )
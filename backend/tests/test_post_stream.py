@@ -0,0 +1,92 @@
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_graph
+from src.api.routes.post import router
+
+UPDATES = [
+    {"parse_intent": {"completed_steps": ["parse_intent"]}},
+    {"assemble_draft": {"draft_version": 1, "completed_steps": ["assemble_draft"]}},
+    {"__interrupt__": ()},
+]
+SNAPSHOT = SimpleNamespace(
+    values={
+        "threads_text": "hello threads",
+        "caption": "hello",
+        "hashtags": ["#hello"],
+        "draft_version": 1,
+        "modalities": ["text"],
+        "target_platforms": ["threads"],
+        "completed_steps": ["parse_intent", "assemble_draft"],
+        "status": "running",
+    },
+    next=("await_review",),
+)
+
+
+class FakeGraph:
+    async def astream(self, input_state, *, config, stream_mode):
+        for update in UPDATES:
+            yield update
+
+    async def ainvoke(self, input_state, *, config):
+        return SNAPSHOT.values
+
+    async def aget_state(self, config):
+        return SNAPSHOT
+
+
+class FailingGraph:
+    async def astream(self, input_state, *, config, stream_mode):
+        yield {"parse_intent": {"completed_steps": ["parse_intent"]}}
+        raise RuntimeError("checkpointer unavailable")
+
+    async def aget_state(self, config):
+        raise AssertionError("aget_state should not be reached")
+
+
+def make_client(graph) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_graph] = lambda: graph
+    return TestClient(app)
+
+
+def parse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+def test_stream_emits_updates_then_done():
+    client = make_client(FakeGraph())
+
+    streamed = client.post("/posts/stream", json={"user_prompt": "hello"})
+    created = client.post("/posts", json={"user_prompt": "hello"})
+
+    events = parse_events(streamed.text)
+    assert [name for name, _ in events] == ["partial", "partial", "done"]
+    assert [data for _, data in events[:2]] == UPDATES[:2]
+    assert "__interrupt__" not in streamed.text
+
+    done = events[-1][1]
+    expected = created.json()
+    assert done.pop("thread_id").startswith("thread_")
+    assert expected.pop("thread_id").startswith("thread_")
+    assert done == expected
+    assert done["status"] == "awaiting_review"
+
+
+def test_stream_emits_error_event_when_graph_fails():
+    response = make_client(FailingGraph()).post("/posts/stream", json={"user_prompt": "hello"})
+
+    assert response.status_code == 200
+    assert "event: partial" in response.text
+    assert response.text.rstrip().endswith(
+        'event: error\ndata: {"detail": "checkpointer unavailable"}'
+    )